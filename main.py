@@ -1,4 +1,5 @@
-import os, sys, subprocess, time, random, asyncio, datetime, shutil
+import os, sys, subprocess, time, random, asyncio, datetime, shutil, re
+from collections import deque
 
 # --- make sure required packages exist (auto-install) ---
 def pip_install(pkg):
@@ -31,6 +32,32 @@ except ImportError:
     pip_install("openai")
     import openai
 
+try:
+    import httpx
+except ImportError:
+    print("Installing httpx...")
+    pip_install("httpx")
+    import httpx
+
+try:
+    from cachetools import LRUCache, TTLCache
+except ImportError:
+    print("Installing cachetools...")
+    pip_install("cachetools")
+    from cachetools import LRUCache, TTLCache
+
+uvloop = None
+if sys.platform != "win32":  # uvloop is POSIX-only
+    try:
+        import uvloop
+    except ImportError:
+        print("Installing uvloop...")
+        pip_install("uvloop")
+        try:
+            import uvloop
+        except ImportError:
+            pass  # optional speedup, the default asyncio loop still works
+
 from discord.ext import commands, tasks
 from aiohttp import web
 
@@ -42,26 +69,94 @@ DAILY_HOUR = int(os.getenv("DAILY_HOUR", "20"))               # daily meme hour
 MEME_INTERVAL = int(os.getenv("MEME_INTERVAL", "30"))          # minutes between automatic memes
 WEB_PORT = int(os.getenv("PORT", "8000"))                     # web server port (Railway uses PORT env var)
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")                       # OpenAI API key for intelligent responses
+OPENAI_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "10"))  # max OpenAI requests in flight at once
 
 # --- discord setup ---
 intents = discord.Intents.default()
 intents.message_content = True
 intents.voice_states = True
-bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+
+# --- shared HTTP session (created once the event loop is running) ---
+http_session: aiohttp.ClientSession | None = None
+
+class MeowsterBot(commands.Bot):
+    async def setup_hook(self):
+        """Create the shared HTTP session so meme fetches reuse pooled connections"""
+        global http_session
+        http_session = aiohttp.ClientSession(
+            timeout=ClientTimeout(total=15),
+            # 75s keepalive matches nginx's default so pooled sockets survive between memes
+            connector=aiohttp.TCPConnector(
+                limit=50,
+                limit_per_host=10,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True
+            )
+        )
+        if AUDIO_FILES and has_ffmpeg():
+            task = self.loop.create_task(decode_meow_sounds())
+            background_tasks.add(task)
+            task.add_done_callback(background_tasks.discard)
+
+    async def close(self):
+        """Close the shared HTTP clients before shutting down"""
+        if http_session and not http_session.closed:
+            await http_session.close()
+        if openai_client:
+            await openai_client.close()  # also closes its httpx connection pool
+        await super().close()
+
+bot = MeowsterBot(command_prefix="!", intents=intents, help_command=None)
+
+START_TIME = time.monotonic()  # for uptime reporting
+
+# --- per-user tracking (one object per user, so on_message does a single lookup) ---
+class UserState:
+    """Everything the bot remembers about one user"""
+    __slots__ = ("count", "chat_history", "last_reply")
+
+    def __init__(self):
+        self.count = 0                    # messages seen (for "active member" personalization)
+        self.chat_history = deque(maxlen=20)  # past OpenAI turns (user/assistant pairs) for context
+        self.last_reply = float("-inf")   # time.monotonic() of our last reply to this user
+
+class UserCache(LRUCache):
+    """LRU of UserState that keeps the active_users counter right when users get evicted"""
+    def popitem(self):
+        global active_users
+        user_id, user = super().popitem()
+        if user.count >= 10:
+            active_users -= 1
+        return user_id, user
 
 # --- tracking dictionaries ---
-last_channel_reply = {}  # channel_id -> timestamp
-last_user_reply = {}     # user_id -> timestamp
-activity_count = {}      # user_id -> number of messages seen (for "active member" personalization)
-user_message_history = {}  # user_id -> list of recent messages for context
+users = UserCache(maxsize=10_000)  # user_id -> UserState, least recently seen evicted first
+active_users = 0         # users with 10+ messages, kept in step by on_message
+# channel cooldown entries expire on their own, so "still in cooldown" is just a membership test
+last_channel_reply = TTLCache(maxsize=10_000, ttl=CHANNEL_COOLDOWN)  # channel_ids replied to recently
+background_tasks = set()  # fire-and-forget tasks (strong refs so they aren't garbage collected)
+meme_queue = asyncio.Queue(maxsize=8)  # pre-fetched meme URLs, kept full by meme_producer
+live_meme_fetch = None   # in-flight fetch shared by callers that find meme_queue empty
+target_channels = {}     # guild_id -> channel_id picked for memes (kept fresh by guild/channel events)
 
 # --- OpenAI client setup ---
 openai_client = None
 if OPENAI_API_KEY:
-    openai_client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    openai_client = openai.AsyncOpenAI(
+        api_key=OPENAI_API_KEY,
+        http_client=httpx.AsyncClient(
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=75)
+        )
+    )
+openai_semaphore = asyncio.Semaphore(OPENAI_CONCURRENCY)  # shared across all message handlers
+
+# --- cat keyword triggers (one compiled scan instead of a substring check per keyword) ---
+CAT_RE = re.compile(r"meow|purr|cat|kitten|kitty|feline|whiskers|paw|tail", re.IGNORECASE)
 
-# --- cat-themed responses ---
-cat_phrases = [
+# --- cat-themed responses (tuples: built once, never mutated) ---
+CAT_PHRASES = (
     "Meowdy!",
     "Purrhaps... 🐾", 
     "Cats > Humans 🐈",
@@ -94,75 +189,307 @@ cat_phrases = [
     "Knock knock. Who’s there? Not your glass anymore. 💥",
     "Meowgic is everywhere. ✨🐾",
     "Bow before your fluffy overlord. 👑🐈"
-]
+)
+REACTIONS = ("🐱", "😺", "😸", "😹", "😻", "🐾", "❤️")
+GENERAL_RE = re.compile(r"general|chat|main|lobby", re.IGNORECASE)  # channel names that look like the main chat
 
-async def get_intelligent_response(user_name, user_messages, current_message):
-    """Generate intelligent response using OpenAI based on user's message history"""
+# --- mood-based reply pools (fallback when an OpenAI reply isn't available) ---
+MOOD_POOLS = {
+    "happy": (
+        "Ayy I see those good vibes ✨",
+        "Keep shining, you’re glowing fr 🌞",
+        "This energy >>> 💯",
+        "Positive vibes detected 🚀"
+    ),
+    "sad": (
+        "Dang… who hurt u? 🥺",
+        "Sending u a digital hug 🤗",
+        "It’s okay, better days loading ⏳",
+        "Lowkey wanna just sit and vibe in silence? 😔"
+    ),
+    "grumpy": (
+        "Chill fam 😤",
+        "Relax or imma ratio u rn 💀",
+        "No cap, your blood pressure is typing 💢",
+        "Talk to me nice before I go demon mode 🔥"
+    ),
+    "neutral": (
+        "Hmm, noted 👀",
+        "Bet. 🫡",
+        "Cool cool 😎",
+        "Just vibin’ rn 🌌"
+    ),
+    "sarcastic": (
+        "Wow… groundbreaking… truly life-changing 🙄",
+        "Oh yeah, that’s definitely the smartest thing I’ve ever heard 🥴",
+        "Congrats, you just unlocked the ‘Captain Obvious’ badge 🎖️",
+        "Oh look, another genius thought… we’re saved 😹",
+        "Woah, careful, your sarcasm detector just broke 💀",
+        "Imagine saying that out loud and thinking it was deep 😌",
+        "Clap, clap 👏… should we nominate you for a Nobel Prize?",
+        "That’s so original… I’ve only heard it 3,000 times 🤡",
+        "If brains were WiFi, you’d be… well, still buffering 📡",
+        "Bro, did you rehearse that line in the mirror or what? 😂",
+        "Ohh wow, your creativity just *shooketh* the world 😱",
+        "That joke aged like spoiled milk 🥛🤢",
+        "Sarcasm level = Internet comment section 🗿",
+        "You just dropped a mic… but it wasn’t plugged in 🎤",
+        "Congrats, you’re officially the human version of ‘meh’ 🙃",
+        "That comeback… whew, so powerful, I almost fainted 🪦",
+        "Was that supposed to sting? Because I’m still chillin 😎",
+        "You’re literally the reason facepalms exist 🤦",
+        "Wow… hold on, I need a dictionary for that brainwave 📖",
+        "Keep talking, I’m collecting material for my comedy show 🎭"
+    ),
+    "savage": (
+        "Sit down bestie, the main character just logged in 💅",
+        "Not everyone can handle this energy 🔥 stay mad",
+        "Cry about it, I’ll stay iconic 😘",
+        "You talk too much, but do you deliver? Didn’t think so 💀",
+        "Zero chills given, 100% slay mode activated 💃",
+        "I don’t compete, I dominate ✨",
+        "Stay pressed, it looks good on you 🧂",
+        "You tried… it flopped… moving on 📉",
+        "My vibe? Untouchable. Your vibe? WiFi with 1 bar 📶",
+        "Imagine hating me and still stalking my energy 👀",
+        "I’m the drama AND the plot twist 😼",
+        "If life’s a stage, you’re still doing rehearsals 🎬",
+        "Keep your opinion… I’m collecting trophies not advice 🏆",
+        "Bold of you to think I care 😏",
+        "Don’t hate me, hate your own weak aura 🤡",
+        "Main character energy only, NPCs can exit 🚪",
+        "Your shade? Expired. My shine? Eternal ☀️",
+        "Sorry bestie, but your vibe got declined 💳",
+        "Stay salty, I’m seasoned 🌶️",
+        "You can’t compete where you don’t compare 💎"
+    ),
+    "genz": (
+        "No cap, that was bussin 🔥",
+        "Lowkey vibin with that ngl 😎",
+        "Sheeeesh, certified moment 🥶",
+        "Not me living for this rn 👀",
+        "Big W energy 💯",
+        "Bro really said THAT 💀",
+        "Main character vibes detected 🎬",
+        "That’s a whole vibe fr 🌀",
+        "Highkey iconic, can’t lie 🌟",
+        "I’m deceased 💀💀💀",
+        "Caught in 4K with that energy 📸",
+        "Touch grass pls 🌱",
+        "That hit different ngl 🫠",
+        "Bruh moment if I’ve ever seen one 🤦",
+        "Certified fresh meme energy 📲",
+        "This comment just passed the vibe check ✅",
+        "Mad respect, no printer 🖨️",
+        "Chill, this is peak Gen Z humor 🤪",
+        "That line slapped harder than WiFi at 2 AM 📡",
+        "Not the flex I expected, but I’ll allow it 💪"
+    ),
+    "love": (
+        "Ayo bestie, you matter more than you think 💕",
+        "Sending you digital hugs rn 🤗",
+        "Not me actually caring about you sm 💖",
+        "You’re literally the reason the vibe is alive 🌸",
+        "Stay soft, stay glowing ✨",
+        "Can we protect this human at all costs pls 🛡️",
+        "Love u but like in a chaotic homie way 💜",
+        "Bestie, drink water and don’t forget to eat 🥤🍕",
+        "You deserve the world, not just this chat 🌎",
+        "Your aura? Chef’s kiss 💋",
+        "Honestly iconic AND wholesome 💐",
+        "Nobody asked but you’re amazing btw 🌟",
+        "Pls never doubt your glow 🌈",
+        "This bot stans you, period 💅",
+        "Heart eyes activated 😍",
+        "We don’t deserve your vibe 🥺",
+        "Reminder: You’re enough as you are 💞",
+        "Wholesome overload detected 💟",
+        "Protect this soul forever 🕊️",
+        "ILY but in bot language 🤖❤️"
+    ),
+    "encouragement": (
+        "You got this, bestie 💪",
+        "Don’t stop now, future legend in progress 🌠",
+        "Lowkey proud of you rn 🥹",
+        "Keep grinding, success is typing… ⌨️",
+        "Failures = plot twists, you’re still main character 🎬",
+        "The glow-up is loading, don’t quit ⚡",
+        "Your effort >>> the outcome, fr 🏋️",
+        "Trust me, you’re gonna shock everyone 🔥",
+        "You’re closer than you think 👣",
+        "If no one believes in you, I do 🤝",
+        "Your potential is scary good 😮",
+        "Break limits, not yourself 🦾",
+        "Even Ls are stepping stones 🪨",
+        "Your story? Gonna slap when it’s told 📖",
+        "You’re literally built different 💎",
+        "You’re the spoiler they didn’t expect 💥",
+        "Main quest unlocked, keep pushing 🎮",
+        "Remember why you started, then flex harder 💯",
+        "Patience now = legend later ⏳",
+        "Trust the grind, not the doubt 🚀"
+    ),
+    "angry": (
+        "Bruh, did you just disrespect me? 😡",
+        "Bot rage level 100 unlocked ⚡",
+        "Say that again and I’m uninstalling you 😤",
+        "Keep talking, see what happens 💢",
+        "Nah fam, you just pressed my buttons 🔴",
+        "I swear, one more word and I’m going full caps lock 🔊",
+        "Don’t test me, I run on 0 sleep and 100 energy drinks 😠",
+        "ERROR: too much nonsense detected 🤯",
+        "You’re THIS close to getting roasted alive 🔥",
+        "Who gave you permission to vibe check ME? 😾",
+        "You think I won’t? Bet. 👊",
+        "Warning: sass levels off the charts 🚨",
+        "Not today, human. Not. Today. 🛑",
+        "Do I look like I have patience left? 🪦",
+        "Bruh I will ratio you in 0.2 seconds 📉",
+        "Keep poking, you’ll unlock ‘Demon Bot Mode’ 👹",
+        "No peace, only smoke rn ☁️",
+        "Your energy = trash bin 🗑️",
+        "This ain’t love, this is WAR 💥",
+        "You woke up and chose violence, and so did I 🔪"
+    )
+}
+
+# keywords that select a mood (checked in order); anything else gets a "neutral" reply.
+# The sarcastic/savage/genz/love/encouragement/angry pools have no keywords wired up yet.
+MOOD_KEYWORDS = (
+    ("happy", frozenset({"happy", "yay", "good", "great", "lol", "haha", "fun"})),
+    ("sad", frozenset({"sad", "depressed", "unhappy", "cry", "alone"})),
+    ("grumpy", frozenset({"angry", "mad", "annoyed", "rage", "hate"}))
+)
+WORD_RE = re.compile(r"[a-z]+")
+
+def choose_mood_reply(text):
+    """Pick a reply from the pool matching the mood of the message"""
+    words = set(WORD_RE.findall(text.lower()))
+    
+    # --- Mood detection based on keywords ---
+    mood = "neutral"
+    for candidate, keywords in MOOD_KEYWORDS:
+        if not keywords.isdisjoint(words):
+            mood = candidate
+            break
+    
+    # --- Pick a reply from detected mood ---
+    return random.choice(MOOD_POOLS[mood])
+
+async def mood_reply(message):
+    """Reply with a line matching the mood of the message"""
+    await message.channel.send(choose_mood_reply(message.content))
+
+# --- OpenAI system prompt (kept identical across calls so the prompt prefix can be cached) ---
+SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a friendly, playful cat-themed Discord bot. "
+               "Respond in a cat-themed, friendly way. Keep it short (1-2 sentences). Use cat puns and emojis."
+}
+
+async def get_intelligent_response(user_name, chat_history, current_message):
+    """Generate intelligent response using OpenAI, continuing the user's conversation history"""
     if not openai_client:
         return None
     
     try:
-        # Build context from recent messages
-        context = f"You are a friendly, playful cat-themed Discord bot. You're responding to {user_name}.\n"
-        context += f"Recent messages from {user_name}:\n"
-        for msg in user_messages[-5:]:  # Last 5 messages for context
-            context += f"- {msg}\n"
-        context += f"Current message: {current_message}\n\n"
-        context += "Respond in a cat-themed, friendly way. Keep it short (1-2 sentences). Use cat puns and emojis."
+        # Stable system prompt, then earlier turns, then the new message
+        user_turn = {"role": "user", "content": f"{user_name}: {current_message}"}
         
-        response = openai_client.chat.completions.create(
-            model="gpt-4o",  # the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
-            messages=[
-                {"role": "system", "content": context},
-                {"role": "user", "content": current_message}
-            ],
-            max_tokens=100,
-            temperature=0.8
-        )
+        # Concurrent handlers share one limit so chatty channels don't trip OpenAI rate limits
+        async with openai_semaphore:
+            stream = await openai_client.chat.completions.create(
+                model="gpt-4o",  # the newest OpenAI model is "gpt-4o" which was released May 13, 2024. do not change this unless explicitly requested by the user
+                messages=[SYSTEM_MESSAGE, *chat_history, user_turn],
+                max_tokens=100,
+                temperature=0.8,
+                timeout=15,
+                stream=True
+            )
+            parts = []
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
         
-        content = response.choices[0].message.content
-        return content.strip() if content else None
+        content = "".join(parts).strip()
+        if not content:
+            return None
+        chat_history.extend((user_turn, {"role": "assistant", "content": content}))
+        return content
     except Exception as e:
         print(f"Error generating intelligent response: {e}")
         return None
 
-async def get_cat_meme():
+async def reply_with_llm(message, chat_history):
+    """Reply with an OpenAI response, falling back to a mood-based reply"""
+    user_name = message.author.display_name
+    try:
+        # Show "typing..." right away so the reply feels responsive while the model streams
+        async with message.channel.typing():
+            # Get intelligent response based on conversation history
+            intelligent_response = await get_intelligent_response(user_name, chat_history, message.content)
+        if intelligent_response:
+            await message.channel.send(f"@{user_name} {intelligent_response}")
+        else:
+            await mood_reply(message)
+    except Exception as e:
+        print(f"Error sending intelligent response: {e}")
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp')  # meme URLs we can embed
+
+async def fetch_cat_meme():
     """Fetch a random cat meme from Reddit via meme API"""
     subreddits = ["catmemes", "cats", "CatGifs", "blackcats", "orangecats", "IllegallySmolCats"]
     url = f"https://meme-api.com/gimme/{random.choice(subreddits)}"
     
-    async with aiohttp.ClientSession() as session:
-        try:
-            async with session.get(url, timeout=ClientTimeout(total=15)) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    # Verify it's an image URL
-                    image_url = data.get("url")
-                    if image_url and any(ext in image_url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-                        return image_url
-                    return None
-        except Exception as e:
-            print(f"Error fetching cat meme: {e}")
-            return None
+    try:
+        async with http_session.get(url) as response:
+            if response.status == 200:
+                data = await response.json()
+                # Verify it's an image URL
+                image_url = data.get("url")
+                if image_url and image_url.lower().endswith(IMAGE_EXTENSIONS):
+                    return image_url
+                return None
+    except Exception as e:
+        print(f"Error fetching cat meme: {e}")
+        return None
+
+async def get_cat_meme():
+    """Get a pre-fetched cat meme, falling back to a live fetch when none are ready"""
+    global live_meme_fetch
+    try:
+        return meme_queue.get_nowait()
+    except asyncio.QueueEmpty:
+        pass
+    
+    # Callers arriving while a live fetch is in flight share its result instead of each hitting the API
+    if live_meme_fetch is None or live_meme_fetch.done():
+        live_meme_fetch = asyncio.ensure_future(fetch_cat_meme())
+    return await asyncio.shield(live_meme_fetch)
 
 # --- tiny website so deployment services can keep this bot alive ---
 web_app = web.Application()
+health_body = b""          # last rendered health check text, reused for rapid keep-alive pings
+health_body_expires = 0.0  # time.monotonic() after which health_body is re-rendered
 
 async def handle_root(request):
     """Health check endpoint"""
-    uptime = time.time() - getattr(bot, '_start_time', time.time())
-    return web.Response(
-        text=f"🐾 Meowster Bot is alive! 😺\nUptime: {uptime:.1f} seconds\nServers: {len(bot.guilds)}",
-        content_type="text/plain"
-    )
+    global health_body, health_body_expires
+    now = time.monotonic()
+    if now >= health_body_expires:
+        uptime = now - START_TIME
+        health_body = f"🐾 Meowster Bot is alive! 😺\nUptime: {uptime:.1f} seconds\nServers: {len(bot.guilds)}".encode()
+        health_body_expires = now + 1
+    return web.Response(body=health_body, content_type="text/plain", charset="utf-8")
 
 async def handle_stats(request):
     """Bot statistics endpoint"""
     stats = {
         "servers": len(bot.guilds),
-        "users_tracked": len(activity_count),
-        "active_users": sum(1 for count in activity_count.values() if count >= 10),
-        "uptime": time.time() - getattr(bot, '_start_time', time.time())
+        "users_tracked": len(users),
+        "active_users": active_users,
+        "uptime": time.monotonic() - START_TIME
     }
     return web.json_response(stats)
 
@@ -185,27 +512,40 @@ def pick_channel_for_guild(guild: discord.Guild):
     if guild.system_channel and guild.system_channel.permissions_for(me).send_messages:
         return guild.system_channel
     
-    # Look for a general chat channel
-    general_names = ["general", "chat", "main", "lobby"]
-    for channel in guild.text_channels:
-        if any(name in channel.name.lower() for name in general_names):
-            perms = channel.permissions_for(me)
-            if perms.view_channel and perms.send_messages:
-                return channel
-    
-    # Fall back to first writable text channel
+    # Look for a general chat channel, remembering the first writable one as a fallback
+    fallback = None
     for channel in guild.text_channels:
+        is_general = GENERAL_RE.search(channel.name)
+        if fallback and not is_general:
+            continue  # already have a fallback, only general channels are worth a permission check
         perms = channel.permissions_for(me)
         if perms.view_channel and perms.send_messages:
-            return channel
+            if is_general:
+                return channel
+            fallback = channel
     
-    return None
+    return fallback
+
+def refresh_target_channel(guild: discord.Guild):
+    """Re-pick the meme channel for a single guild"""
+    channel = pick_channel_for_guild(guild)
+    if channel:
+        target_channels[guild.id] = channel.id
+    else:
+        target_channels.pop(guild.id, None)
+    return channel
 
 def get_all_target_channels():
     """Get all channels where the bot can send memes"""
-    channels = []
+    # Guilds without a writable channel get another look each tick, since some
+    # permission changes (e.g. the bot being given a role) fire no event we handle
     for guild in bot.guilds:
-        channel = pick_channel_for_guild(guild)
+        if guild.id not in target_channels:
+            refresh_target_channel(guild)
+    
+    channels = []
+    for channel_id in target_channels.values():
+        channel = bot.get_channel(channel_id)
         if channel:
             channels.append(channel)
     return channels
@@ -213,112 +553,179 @@ def get_all_target_channels():
 @bot.event
 async def on_ready():
     """Bot startup event"""
-    setattr(bot, '_start_time', time.time())
     print(f"✅ {bot.user} is now online!")
     print(f"📊 Connected to {len(bot.guilds)} server(s)")
     print(f"🐾 Cat memes will be posted every {MEME_INTERVAL} minutes")
     print(f"📅 Daily memes scheduled for {DAILY_HOUR}:00")
     
+    # Pick meme channels once; guild/channel events keep them up to date afterwards
+    for guild in bot.guilds:
+        refresh_target_channel(guild)
+    
     # Start web server for keep-alive
     if not getattr(bot, "_web_started", False):
         await start_web_server()
         setattr(bot, '_web_started', True)
     
     # Start background tasks
+    if not meme_producer.is_running():
+        meme_producer.start()
     if not send_cat_stuff.is_running():
         send_cat_stuff.start()
     if not daily_cat_meme.is_running():
         daily_cat_meme.start()
 
+# Welcome embed never changes, so build its payload once
+WELCOME_EMBED = discord.Embed(
+    title="🐾 Meow! Thanks for adding me!",
+    description="I'm your friendly cat-themed bot! Here's what I can do:",
+    color=0xFF6B9D
+).add_field(
+    name="🎭 Automatic Features",
+    value="• Cat memes every 30 minutes\n• Daily meme delivery\n• Random cat reactions\n• Activity-based responses",
+    inline=False
+).add_field(
+    name="🎵 Voice Commands",
+    value="• `!join` - Join voice channel\n• `!leave` - Leave voice channel\n• Random meow sounds (if .mp3 files available)",
+    inline=False
+).add_field(
+    name="💡 Tips",
+    value="• Mention cats, meows, or purrs for instant memes!\n• Active chatters get personalized responses\n• Bot responds naturally to conversations",
+    inline=False
+).to_dict()
+
 @bot.event
 async def on_guild_join(guild):
     """Welcome message when bot joins a new server"""
-    channel = pick_channel_for_guild(guild)
+    channel = refresh_target_channel(guild)
     if channel:
-        embed = discord.Embed(
-            title="🐾 Meow! Thanks for adding me!",
-            description="I'm your friendly cat-themed bot! Here's what I can do:",
-            color=0xFF6B9D
-        )
-        embed.add_field(
-            name="🎭 Automatic Features",
-            value="• Cat memes every 30 minutes\n• Daily meme delivery\n• Random cat reactions\n• Activity-based responses",
-            inline=False
-        )
-        embed.add_field(
-            name="🎵 Voice Commands",
-            value="• `!join` - Join voice channel\n• `!leave` - Leave voice channel\n• Random meow sounds (if .mp3 files available)",
-            inline=False
-        )
-        embed.add_field(
-            name="💡 Tips",
-            value="• Mention cats, meows, or purrs for instant memes!\n• Active chatters get personalized responses\n• Bot responds naturally to conversations",
-            inline=False
-        )
-        
         try:
-            await channel.send(embed=embed)
+            await channel.send(embed=discord.Embed.from_dict(WELCOME_EMBED))
         except Exception as e:
             print(f"Could not send welcome message to {guild.name}: {e}")
 
+async def post_cat_stuff(channel, meme_url):
+    """Post a random phrase or this tick's meme to a single channel"""
+    try:
+        # 50% chance for phrase, 50% chance for meme
+        if random.getrandbits(1):
+            await channel.send(random.choice(CAT_PHRASES))
+        else:
+            if meme_url:
+                await channel.send(f"🐾 {meme_url}")
+            else:
+                # Fallback to phrase if meme fetch fails
+                await channel.send(random.choice(CAT_PHRASES))
+    except (discord.Forbidden, discord.NotFound) as e:
+        # Lost access to this channel without an event telling us, pick another one
+        print(f"Can't post to #{channel.name} in {channel.guild.name} anymore: {e}")
+        refresh_target_channel(channel.guild)
+    except Exception as e:
+        print(f"Error sending cat content to {channel.guild.name}: {e}")
+
+async def post_daily_meme(channel, embed: discord.Embed):
+    """Post the daily meme embed to a single channel"""
+    try:
+        await channel.send(embed=embed)
+    except (discord.Forbidden, discord.NotFound) as e:
+        # Lost access to this channel without an event telling us, pick another one
+        print(f"Can't post to #{channel.name} in {channel.guild.name} anymore: {e}")
+        refresh_target_channel(channel.guild)
+    except Exception as e:
+        print(f"Error sending daily meme to {channel.guild.name}: {e}")
+
+@bot.event
+async def on_guild_remove(guild):
+    """Stop posting to servers the bot has left"""
+    target_channels.pop(guild.id, None)
+
+@bot.event
+async def on_guild_update(before, after):
+    """System channel may have changed, re-pick the meme channel"""
+    refresh_target_channel(after)
+
+@bot.event
+async def on_guild_channel_create(channel):
+    """A new channel may be a better fit for memes"""
+    refresh_target_channel(channel.guild)
+
+@bot.event
+async def on_guild_channel_update(before, after):
+    """Renames and permission overwrites can change the meme channel"""
+    refresh_target_channel(after.guild)
+
+@bot.event
+async def on_guild_channel_delete(channel):
+    """The meme channel may have been deleted"""
+    refresh_target_channel(channel.guild)
+
+@bot.event
+async def on_guild_role_create(role):
+    """New roles can carry channel overwrites or permissions that affect send access"""
+    refresh_target_channel(role.guild)
+
+@bot.event
+async def on_guild_role_update(before, after):
+    """Role permission changes can revoke or grant send access"""
+    refresh_target_channel(after.guild)
+
+@bot.event
+async def on_guild_role_delete(role):
+    """Deleting a role the bot relied on can revoke send access"""
+    refresh_target_channel(role.guild)
+
+# Background task: keep meme_queue full so meme requests rarely wait on the API
+@tasks.loop(seconds=0)
+async def meme_producer():
+    """Fetch the next meme, waiting while the queue is full"""
+    meme_url = await fetch_cat_meme()
+    if meme_url:
+        await meme_queue.put(meme_url)
+    else:
+        await asyncio.sleep(5)  # back off while the meme API is failing
+
 # Background task: send cat content every MEME_INTERVAL minutes
 @tasks.loop(minutes=MEME_INTERVAL)
 async def send_cat_stuff():
     """Automatically post cat content to all servers"""
     await bot.wait_until_ready()
     
-    for channel in get_all_target_channels():
-        try:
-            # 50% chance for phrase, 50% chance for meme
-            if random.choice([True, False]):
-                await channel.send(random.choice(cat_phrases))
-            else:
-                meme_url = await get_cat_meme()
-                if meme_url:
-                    await channel.send(f"🐾 {meme_url}")
-                else:
-                    # Fallback to phrase if meme fetch fails
-                    await channel.send(random.choice(cat_phrases))
-        except Exception as e:
-            print(f"Error sending cat content to {channel.guild.name}: {e}")
-            continue
+    # One meme per tick is shared by every server, then all sends run concurrently
+    meme_url = await get_cat_meme()
+    await asyncio.gather(
+        *(post_cat_stuff(channel, meme_url) for channel in get_all_target_channels()),
+        return_exceptions=True
+    )
 
-# Background task: daily cat meme at specified hour
-@tasks.loop(hours=24)
+# Background task: daily cat meme at specified hour (server local time)
+# Scheduling on wall-clock time means slow sends can't make the loop drift
+@tasks.loop(time=datetime.time(hour=DAILY_HOUR, tzinfo=datetime.datetime.now().astimezone().tzinfo))
 async def daily_cat_meme():
     """Send daily cat meme to all servers"""
     await bot.wait_until_ready()
     
-    for channel in get_all_target_channels():
+    # Everyone shares this one meme, so give a failed fetch a few more tries
+    for _ in range(3):
         meme_url = await get_cat_meme()
         if meme_url:
-            try:
-                embed = discord.Embed(
-                    title="🌙 Daily Cat Meme Time! 🐾",
-                    color=0xFF6B9D
-                )
-                embed.set_image(url=meme_url)
-                embed.set_footer(text=f"Delivered at {datetime.datetime.now().strftime('%H:%M')}")
-                await channel.send(embed=embed)
-            except Exception as e:
-                print(f"Error sending daily meme to {channel.guild.name}: {e}")
-                continue
-
-@daily_cat_meme.before_loop
-async def before_daily_cat_meme():
-    """Wait until the specified daily hour before starting the loop"""
-    await bot.wait_until_ready()
-    
-    now = datetime.datetime.now()
-    target_time = datetime.datetime.combine(now.date(), datetime.time(DAILY_HOUR, 0))
+            break
+        await asyncio.sleep(10)
+    else:
+        print("Could not fetch a daily cat meme after 3 attempts, skipping today's delivery")
+        return
     
-    # If we've passed today's target time, schedule for tomorrow
-    if now > target_time:
-        target_time += datetime.timedelta(days=1)
+    # Every server gets the same meme, so build the embed once
+    embed = discord.Embed(
+        title="🌙 Daily Cat Meme Time! 🐾",
+        color=0xFF6B9D
+    )
+    embed.set_image(url=meme_url)
+    embed.set_footer(text=f"Delivered at {datetime.datetime.now().strftime('%H:%M')}")
     
-    sleep_seconds = (target_time - now).total_seconds()
-    print(f"⏰ Daily memes scheduled for {target_time.strftime('%Y-%m-%d %H:%M')}")
-    await asyncio.sleep(sleep_seconds)
+    await asyncio.gather(
+        *(post_daily_meme(channel, embed) for channel in get_all_target_channels()),
+        return_exceptions=True
+    )
 
 @bot.event
 async def on_message(message: discord.Message):
@@ -327,40 +734,40 @@ async def on_message(message: discord.Message):
     if message.author.bot:
         return
 
-    # Track user activity and message history
+    # Track user activity
+    global active_users
     user_id = message.author.id
-    activity_count[user_id] = activity_count.get(user_id, 0) + 1
-    is_active_user = activity_count[user_id] >= 10
+    user = users.get(user_id)
+    if user is None:
+        user = users[user_id] = UserState()
+    user.count += 1
+    if user.count == 10:
+        active_users += 1
+    is_active_user = user.count >= 10
     
-    # Store user's message history for context
-    if user_id not in user_message_history:
-        user_message_history[user_id] = []
-    user_message_history[user_id].append(message.content)
-    # Keep only last 10 messages per user
-    if len(user_message_history[user_id]) > 10:
-        user_message_history[user_id] = user_message_history[user_id][-10:]
+    # Only prefixed messages can be commands, so skip the command parser for everything else
+    is_command = message.content.startswith(bot.command_prefix)
 
     # Check cooldowns
-    now = time.time()
+    now = time.monotonic()
     channel_id = message.channel.id
     
     # Channel cooldown check
-    if channel_id in last_channel_reply and now - last_channel_reply[channel_id] < CHANNEL_COOLDOWN:
-        await bot.process_commands(message)
+    if channel_id in last_channel_reply:
+        if is_command:
+            await bot.process_commands(message)
         return
     
     # User cooldown check
-    if user_id in last_user_reply and now - last_user_reply[user_id] < USER_COOLDOWN:
-        await bot.process_commands(message)
+    if now - user.last_reply < USER_COOLDOWN:
+        if is_command:
+            await bot.process_commands(message)
         return
 
-    content = message.content.lower()
     responded = False
-    user_name = message.author.display_name
 
     # 1) Keyword triggers - instant meme for cat-related words
-    cat_keywords = ["meow", "purr", "cat", "kitten", "kitty", "feline", "whiskers", "paw", "tail"]
-    if any(keyword in content for keyword in cat_keywords):
+    if CAT_RE.search(message.content):
         meme_url = await get_cat_meme()
         if meme_url:
             try:
@@ -371,231 +778,73 @@ async def on_message(message: discord.Message):
 
     # 2) Intelligent responses for online members (prioritize active users)
     elif openai_client and (is_active_user or random.random() < 0.4):  # 100% for active users, 40% for others
-        try:
-            # Always respond to active users and online members
-            # Note: We'll respond regardless of online status for better engagement
-                # Get intelligent response based on message history
-                intelligent_response = await get_intelligent_response(
-                    user_name, 
-                    user_message_history[user_id], 
-                    message.content
-                )
-                
-                if intelligent_response:
-                    await message.channel.send(f"@{user_name} {intelligent_response}")
-                    responded = True
-                else:
-    # Fallback to Mood-based response pools
-Mood-based response pools = 
-{
-    "sarcastic": [
-        "Wow… groundbreaking… truly life-changing 🙄",
-        "Oh yeah, that’s definitely the smartest thing I’ve ever heard 🥴",
-        "Congrats, you just unlocked the ‘Captain Obvious’ badge 🎖️",
-        "Oh look, another genius thought… we’re saved 😹",
-        "Woah, careful, your sarcasm detector just broke 💀",
-        "Imagine saying that out loud and thinking it was deep 😌",
-        "Clap, clap 👏… should we nominate you for a Nobel Prize?",
-        "That’s so original… I’ve only heard it 3,000 times 🤡",
-        "If brains were WiFi, you’d be… well, still buffering 📡",
-        "Bro, did you rehearse that line in the mirror or what? 😂",
-        "Ohh wow, your creativity just *shooketh* the world 😱",
-        "That joke aged like spoiled milk 🥛🤢",
-        "Sarcasm level = Internet comment section 🗿",
-        "You just dropped a mic… but it wasn’t plugged in 🎤",
-        "Congrats, you’re officially the human version of ‘meh’ 🙃",
-        "That comeback… whew, so powerful, I almost fainted 🪦",
-        "Was that supposed to sting? Because I’m still chillin 😎",
-        "You’re literally the reason facepalms exist 🤦",
-        "Wow… hold on, I need a dictionary for that brainwave 📖",
-        "Keep talking, I’m collecting material for my comedy show 🎭"
-    ],
-    "savage": [
-        "Sit down bestie, the main character just logged in 💅",
-        "Not everyone can handle this energy 🔥 stay mad",
-        "Cry about it, I’ll stay iconic 😘",
-        "You talk too much, but do you deliver? Didn’t think so 💀",
-        "Zero chills given, 100% slay mode activated 💃",
-        "I don’t compete, I dominate ✨",
-        "Stay pressed, it looks good on you 🧂",
-        "You tried… it flopped… moving on 📉",
-        "My vibe? Untouchable. Your vibe? WiFi with 1 bar 📶",
-        "Imagine hating me and still stalking my energy 👀",
-        "I’m the drama AND the plot twist 😼",
-        "If life’s a stage, you’re still doing rehearsals 🎬",
-        "Keep your opinion… I’m collecting trophies not advice 🏆",
-        "Bold of you to think I care 😏",
-        "Don’t hate me, hate your own weak aura 🤡",
-        "Main character energy only, NPCs can exit 🚪",
-        "Your shade? Expired. My shine? Eternal ☀️",
-        "Sorry bestie, but your vibe got declined 💳",
-        "Stay salty, I’m seasoned 🌶️",
-        "You can’t compete where you don’t compare 💎"
-    ],
-    "genz": [
-        "No cap, that was bussin 🔥",
-        "Lowkey vibin with that ngl 😎",
-        "Sheeeesh, certified moment 🥶",
-        "Not me living for this rn 👀",
-        "Big W energy 💯",
-        "Bro really said THAT 💀",
-        "Main character vibes detected 🎬",
-        "That’s a whole vibe fr 🌀",
-        "Highkey iconic, can’t lie 🌟",
-        "I’m deceased 💀💀💀",
-        "Caught in 4K with that energy 📸",
-        "Touch grass pls 🌱",
-        "That hit different ngl 🫠",
-        "Bruh moment if I’ve ever seen one 🤦",
-        "Certified fresh meme energy 📲",
-        "This comment just passed the vibe check ✅",
-        "Mad respect, no printer 🖨️",
-        "Chill, this is peak Gen Z humor 🤪",
-        "That line slapped harder than WiFi at 2 AM 📡",
-        "Not the flex I expected, but I’ll allow it 💪"
-    ],
-    "love": [
-        "Ayo bestie, you matter more than you think 💕",
-        "Sending you digital hugs rn 🤗",
-        "Not me actually caring about you sm 💖",
-        "You’re literally the reason the vibe is alive 🌸",
-        "Stay soft, stay glowing ✨",
-        "Can we protect this human at all costs pls 🛡️",
-        "Love u but like in a chaotic homie way 💜",
-        "Bestie, drink water and don’t forget to eat 🥤🍕",
-        "You deserve the world, not just this chat 🌎",
-        "Your aura? Chef’s kiss 💋",
-        "Honestly iconic AND wholesome 💐",
-        "Nobody asked but you’re amazing btw 🌟",
-        "Pls never doubt your glow 🌈",
-        "This bot stans you, period 💅",
-        "Heart eyes activated 😍",
-        "We don’t deserve your vibe 🥺",
-        "Reminder: You’re enough as you are 💞",
-        "Wholesome overload detected 💟",
-        "Protect this soul forever 🕊️",
-        "ILY but in bot language 🤖❤️"
-    ],
-    "encouragement": [
-        "You got this, bestie 💪",
-        "Don’t stop now, future legend in progress 🌠",
-        "Lowkey proud of you rn 🥹",
-        "Keep grinding, success is typing… ⌨️",
-        "Failures = plot twists, you’re still main character 🎬",
-        "The glow-up is loading, don’t quit ⚡",
-        "Your effort >>> the outcome, fr 🏋️",
-        "Trust me, you’re gonna shock everyone 🔥",
-        "You’re closer than you think 👣",
-        "If no one believes in you, I do 🤝",
-        "Your potential is scary good 😮",
-        "Break limits, not yourself 🦾",
-        "Even Ls are stepping stones 🪨",
-        "Your story? Gonna slap when it’s told 📖",
-        "You’re literally built different 💎",
-        "You’re the spoiler they didn’t expect 💥",
-        "Main quest unlocked, keep pushing 🎮",
-        "Remember why you started, then flex harder 💯",
-        "Patience now = legend later ⏳",
-        "Trust the grind, not the doubt 🚀"
-    ],
-    "angry": [
-        "Bruh, did you just disrespect me? 😡",
-        "Bot rage level 100 unlocked ⚡",
-        "Say that again and I’m uninstalling you 😤",
-        "Keep talking, see what happens 💢",
-        "Nah fam, you just pressed my buttons 🔴",
-        "I swear, one more word and I’m going full caps lock 🔊",
-        "Don’t test me, I run on 0 sleep and 100 energy drinks 😠",
-        "ERROR: too much nonsense detected 🤯",
-        "You’re THIS close to getting roasted alive 🔥",
-        "Who gave you permission to vibe check ME? 😾",
-        "You think I won’t? Bet. 👊",
-        "Warning: sass levels off the charts 🚨",
-        "Not today, human. Not. Today. 🛑",
-        "Do I look like I have patience left? 🪦",
-        "Bruh I will ratio you in 0.2 seconds 📉",
-        "Keep poking, you’ll unlock ‘Demon Bot Mode’ 👹",
-        "No peace, only smoke rn ☁️",
-        "Your energy = trash bin 🗑️",
-        "This ain’t love, this is WAR 💥",
-        "You woke up and chose violence, and so did I 🔪"
-    ]
-}
-
-# --- Function to auto-reply ---
-# Mood-based replies dictionary (you already have something like this)
-responses = {
-    "happy": [
-        "Ayy I see those good vibes ✨",
-        "Keep shining, you’re glowing fr 🌞",
-        "This energy >>> 💯",
-        "Positive vibes detected 🚀"
-    ],
-    "sad": [
-        "Dang… who hurt u? 🥺",
-        "Sending u a digital hug 🤗",
-        "It’s okay, better days loading ⏳",
-        "Lowkey wanna just sit and vibe in silence? 😔"
-    ],
-    "angry": [
-        "Chill fam 😤",
-        "Relax or imma ratio u rn 💀",
-        "No cap, your blood pressure is typing 💢",
-        "Talk to me nice before I go demon mode 🔥"
-    ],
-    "neutral": [
-        "Hmm, noted 👀",
-        "Bet. 🫡",
-        "Cool cool 😎",
-        "Just vibin’ rn 🌌"
-    ]
-}
-
-async def mood_reply(message):
-    text = message.content.lower()
-    
-    # --- Mood detection based on keywords ---
-    if any(word in text for word in ["happy", "yay", "good", "great", "lol", "haha", "fun"]):
-        mood = "happy"
-    elif any(word in text for word in ["sad", "depressed", "unhappy", "cry", "alone"]):
-        mood = "sad"
-    elif any(word in text for word in ["angry", "mad", "annoyed", "rage", "hate"]):
-        mood = "angry"
-    else:
-        mood = "neutral"
+        # Always respond to active users and online members
+        # Note: We'll respond regardless of online status for better engagement
+        # The OpenAI round-trip runs in the background so commands and cooldowns aren't held up
+        task = bot.loop.create_task(
+            reply_with_llm(message, user.chat_history),
+            name=f"llm-reply-{message.id}"
+        )
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+        responded = True
 
-    # --- Pick a reply from detected mood ---
-    reply = random.choice(responses[mood])
-    await message.channel.send(reply)
     # 3) Fallback: Random reactions and responses
     elif random.random() < PROBABILITY * 0.5:  # Reduced probability since we have intelligent responses
         # 30% chance for reaction, 70% chance for message
         if random.random() < 0.3:
-            reactions = ["🐱", "😺", "😸", "😹", "😻", "🐾", "❤️"]
             try:
-                await message.add_reaction(random.choice(reactions))
+                await message.add_reaction(random.choice(REACTIONS))
                 responded = True
             except Exception as e:
                 print(f"Error adding reaction: {e}")
         else:
             try:
-                await message.channel.send(random.choice(cat_phrases))
+                await message.channel.send(random.choice(CAT_PHRASES))
                 responded = True
             except Exception as e:
                 print(f"Error sending random phrase: {e}")
 
     # Update cooldowns if we responded
     if responded:
-        last_channel_reply[channel_id] = now
-        last_user_reply[user_id] = now
+        last_channel_reply[channel_id] = True
+        user.last_reply = now
 
     # Process bot commands
-    await bot.process_commands(message)
+    if is_command:
+        await bot.process_commands(message)
 
 # --- Voice functionality (requires FFmpeg) ---
+AUDIO_FILES = tuple(f for f in os.listdir('.') if f.lower().endswith('.mp3'))  # meow sounds, scanned once
+decoded_audio = {}  # mp3 filename -> pre-decoded raw PCM file
+HAS_FFMPEG = shutil.which("ffmpeg") is not None  # PATH is walked once, not on every join/play
+
 def has_ffmpeg():
     """Check if FFmpeg is available for voice functionality"""
-    return shutil.which("ffmpeg") is not None
+    return HAS_FFMPEG
+
+async def decode_meow_sounds():
+    """Decode meow sounds to raw PCM once so replays don't spawn FFmpeg every time"""
+    for audio_file in AUDIO_FILES:
+        pcm_file = audio_file + ".pcm"
+        if not os.path.exists(pcm_file) or os.path.getmtime(pcm_file) < os.path.getmtime(audio_file):
+            # Decode to a temp file and only move it into place once FFmpeg succeeds,
+            # so a failed or interrupted decode never leaves a truncated .pcm behind
+            tmp_file = pcm_file + ".tmp"
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    "ffmpeg", "-nostdin", "-y", "-loglevel", "error", "-i", audio_file,
+                    "-f", "s16le", "-ar", "48000", "-ac", "2", tmp_file,
+                    stdin=subprocess.DEVNULL
+                )
+                if await process.wait() != 0:
+                    print(f"Could not decode {audio_file}, it will be streamed through FFmpeg")
+                    continue
+                os.replace(tmp_file, pcm_file)
+            finally:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+        decoded_audio[audio_file] = pcm_file
 
 @bot.command(name="join")
 async def join_voice(ctx):
@@ -639,14 +888,11 @@ async def play_random_meows(ctx):
     if not voice_client or not has_ffmpeg():
         return
     
-    # Look for .mp3 files in the current directory
-    audio_files = [f for f in os.listdir('.') if f.lower().endswith('.mp3')]
-    
-    if not audio_files:
+    if not AUDIO_FILES:
         await ctx.send("🎵 No .mp3 meow files found! Upload some meow sounds as .mp3 files to enable this feature.")
         return
     
-    await ctx.send(f"🎵 Found {len(audio_files)} meow sounds! Playing randomly...")
+    await ctx.send(f"🎵 Found {len(AUDIO_FILES)} meow sounds! Playing randomly...")
     
     while voice_client.is_connected():
         # Wait 1-3 minutes between meows
@@ -657,12 +903,24 @@ async def play_random_meows(ctx):
             
         try:
             if not voice_client.is_playing():
-                audio_file = random.choice(audio_files)
-                voice_client.play(discord.FFmpegPCMAudio(audio_file))
-                
-                # Wait for audio to finish
-                while voice_client.is_playing():
-                    await asyncio.sleep(1)
+                audio_file = random.choice(AUDIO_FILES)
+                pcm_file = decoded_audio.get(audio_file)
+                if pcm_file:
+                    source = discord.PCMAudio(open(pcm_file, 'rb'))
+                else:
+                    source = discord.FFmpegPCMAudio(audio_file)
+                try:
+                    voice_client.play(source)
+                    
+                    # Wait for audio to finish
+                    while voice_client.is_playing():
+                        await asyncio.sleep(1)
+                finally:
+                    # Release the PCM file / FFmpeg process even if play fails or we get cancelled
+                    if pcm_file:
+                        source.stream.close()
+                    else:
+                        source.cleanup()
         except Exception as e:
             print(f"Error playing audio: {e}")
             await asyncio.sleep(10)  # Wait before trying again
@@ -671,7 +929,7 @@ async def play_random_meows(ctx):
 @bot.command(name="stats")
 async def bot_stats(ctx):
     """Display bot statistics"""
-    uptime = time.time() - getattr(bot, '_start_time', time.time())
+    uptime = time.monotonic() - START_TIME
     uptime_str = str(datetime.timedelta(seconds=int(uptime)))
     
     embed = discord.Embed(
@@ -679,8 +937,8 @@ async def bot_stats(ctx):
         color=0xFF6B9D
     )
     embed.add_field(name="🏠 Servers", value=len(bot.guilds), inline=True)
-    embed.add_field(name="👥 Users Tracked", value=len(activity_count), inline=True)
-    embed.add_field(name="⭐ Active Users", value=sum(1 for count in activity_count.values() if count >= 10), inline=True)
+    embed.add_field(name="👥 Users Tracked", value=len(users), inline=True)
+    embed.add_field(name="⭐ Active Users", value=active_users, inline=True)
     embed.add_field(name="⏰ Uptime", value=uptime_str, inline=True)
     embed.add_field(name="🎵 Voice Ready", value="✅ Yes" if has_ffmpeg() else "❌ No (FFmpeg needed)", inline=True)
     embed.add_field(name="📅 Next Daily Meme", value=f"{DAILY_HOUR}:00", inline=True)
@@ -700,34 +958,29 @@ async def manual_meme(ctx):
         else:
             await ctx.send("😿 Couldn't fetch a meme right now. Try again in a moment!")
 
+# Help embed only depends on startup settings, so build its payload once
+HELP_EMBED = discord.Embed(
+    title="🐾 Meowster Bot Help",
+    description="Your friendly cat-themed Discord companion!",
+    color=0xFF6B9D
+).add_field(
+    name="🎭 Automatic Features",
+    value=f"• Cat memes every {MEME_INTERVAL} minutes\n• Daily meme at {DAILY_HOUR}:00\n• Reacts to cat keywords\n• Personalized responses for active users",
+    inline=False
+).add_field(
+    name="🎮 Commands",
+    value="• `!meme` - Get instant cat meme\n• `!stats` - Bot statistics\n• `!join` - Join voice channel\n• `!leave` - Leave voice channel\n• `!help` - This help message",
+    inline=False
+).add_field(
+    name="💡 Tips",
+    value="• Say 'meow', 'cat', 'purr' etc. for instant memes!\n• Be active in chat for personalized responses\n• Upload .mp3 files for voice meows",
+    inline=False
+).to_dict()
+
 @bot.command(name="help")
 async def bot_help(ctx):
     """Display help information"""
-    embed = discord.Embed(
-        title="🐾 Meowster Bot Help",
-        description="Your friendly cat-themed Discord companion!",
-        color=0xFF6B9D
-    )
-    
-    embed.add_field(
-        name="🎭 Automatic Features",
-        value=f"• Cat memes every {MEME_INTERVAL} minutes\n• Daily meme at {DAILY_HOUR}:00\n• Reacts to cat keywords\n• Personalized responses for active users",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="🎮 Commands",
-        value="• `!meme` - Get instant cat meme\n• `!stats` - Bot statistics\n• `!join` - Join voice channel\n• `!leave` - Leave voice channel\n• `!help` - This help message",
-        inline=False
-    )
-    
-    embed.add_field(
-        name="💡 Tips",
-        value="• Say 'meow', 'cat', 'purr' etc. for instant memes!\n• Be active in chat for personalized responses\n• Upload .mp3 files for voice meows",
-        inline=False
-    )
-    
-    await ctx.send(embed=embed)
+    await ctx.send(embed=discord.Embed.from_dict(HELP_EMBED))
 
 # --- Error handling ---
 @bot.event
@@ -754,6 +1007,10 @@ def main():
         print("🔗 Get your token from: https://discord.com/developers/applications")
         return
     
+    # Faster libuv-based event loop when available
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     try:
         print("🚀 Starting Meowster Bot...")
         bot.run(token)